@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+import psutil
+from config import CONFIG
+from state import FloodPredictionState
+from data_loader import DataLoaderAgent
+from preprocessor import PreprocessorAgent, engineer_features
+from model_trainer import ModelTrainerAgent
+from model_tuner import ModelTunerAgent
+from distiller import DistillerAgent
+from explainer import ExplainerAgent
+from predictor import PredictorAgent
+from dashboard import DashboardAgent
+from streaming_linear import StreamingLinearRegression
+from pipeline import FloodPredictionWorkflow
+from benchmarks.synthetic import FloodDataGenerator, dataset_path
+
+class PeakMemory:
+    """Track peak resident memory above the starting level by sampling in a background thread."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.process = psutil.Process()
+
+    def __enter__(self):
+        self.baseline = self.peak = self.process.memory_info().rss
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+        self.peak_mb = (self.peak - self.baseline) / 1e6
+
+def measure(results: dict, stage: str, fn, *args, repeats: int = 1):
+    """Run fn, recording mean wall time per call and peak RSS growth under `stage`."""
+    with PeakMemory() as memory:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            output = fn(*args)
+        seconds = (time.perf_counter() - start) / repeats
+    results[stage] = {'seconds': seconds, 'peak_rss_mb': memory.peak_mb}
+    print(f"  {stage:<32} {seconds:10.4f} s {memory.peak_mb:10.1f} MB")
+    return output
+
+def benchmark_dataset(path: str, config: dict, models: list, predict_repeats: int) -> dict:
+    results = {}
+    state = FloodPredictionState(data_path=path)
+    state = measure(results, 'load_data', DataLoaderAgent().load_data, state)
+    state = measure(results, 'preprocess_data', PreprocessorAgent(config).preprocess_data, state)
+    
+    # Train each model on its own so per-model cost is visible
+    trainer = ModelTrainerAgent(config)
+    model_classes = dict(trainer.models)
+    all_models, all_metrics = {}, {}
+    for model_name in models:
+        trainer.models = {model_name: model_classes[model_name]}
+        state = measure(results, f'train_models.{model_name}', trainer.train_models, state)
+        all_models.update(state.models)
+        all_metrics.update(state.model_metrics)
+    state.models, state.model_metrics = all_models, all_metrics
+    
+    linear_params = config['model_params'].get('LinearRegression', {})
+    measure(results, 'train_linear_streaming_csv', StreamingLinearRegression(**linear_params).fit_csv,
+            path, 'FloodProbability', engineer_features, config['test_size'], config['random_state'])
+    
+    state = measure(results, 'tune_best_model', ModelTunerAgent(config).tune_best_model, state)
+    state = measure(results, 'distill_model', DistillerAgent(config).distill_model, state)
+    state = measure(results, 'explain_model', ExplainerAgent(config).explain_model, state)
+    
+    predictor = PredictorAgent(config)
+    sample_input = state.X_test.iloc[0].to_dict()
+    measure(results, 'predict.single', predictor.predict, state, sample_input, repeats=predict_repeats)
+    batch = state.X_test.iloc[:10000]
+    measure(results, 'predict.batch10k', predictor.serving_model(state).predict, batch)
+    measure(results, 'setup_dashboard.build_figures', DashboardAgent(config).build_figures, state)
+    
+    benchmark_analysis_stages(results, state, config)
+    return results
+
+def benchmark_analysis_stages(results: dict, state: FloodPredictionState, config: dict):
+    """Time the graph's analysis section (explain_model ... merge_stages) on one tuned state, chained and fanned out."""
+    with tempfile.TemporaryDirectory() as output_dir:
+        for parallel in (False, True):
+            graph_config = dict(config, output_dir=output_dir, parallel_stages=parallel)
+            workflow = FloodPredictionWorkflow(graph_config, analysis_only=True)
+            measure(results, f"analysis_stages.{'parallel' if parallel else 'sequential'}", workflow.run_analysis, state)
+
+def compare(current: dict, baseline: dict, time_threshold: float, memory_threshold: float,
+            min_seconds: float, min_mb: float) -> list:
+    """List stages whose time or memory grew beyond the thresholds relative to the baseline."""
+    regressions = []
+    for rows, stages in current['results'].items():
+        for stage, measured in stages.items():
+            reference = baseline.get('results', {}).get(rows, {}).get(stage)
+            if reference is None:
+                continue
+            checks = [('seconds', time_threshold, min_seconds), ('peak_rss_mb', memory_threshold, min_mb)]
+            for metric, threshold, floor in checks:
+                # Ignore growth below the noise floor so tiny stages do not flap
+                if measured[metric] > max(reference[metric] * threshold, reference[metric] + floor):
+                    regressions.append({
+                        'rows': rows, 'stage': stage, 'metric': metric,
+                        'baseline': reference[metric], 'current': measured[metric],
+                        'ratio': measured[metric] / reference[metric] if reference[metric] else float('inf')
+                    })
+    return regressions
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the flood prediction pipeline on synthetic data")
+    parser.add_argument('--rows', type=int, nargs='+', default=[50000])
+    parser.add_argument('--models', nargs='+', default=list(CONFIG['model_params']))
+    parser.add_argument('--data-dir', default='benchmarks/data')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--predict-repeats', type=int, default=100)
+    parser.add_argument('--output', default=None, help="Results JSON (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--baseline', default='benchmarks/baseline.json')
+    parser.add_argument('--update-baseline', action='store_true', help="Write these results as the new baseline")
+    parser.add_argument('--time-threshold', type=float, default=1.25)
+    parser.add_argument('--memory-threshold', type=float, default=1.25)
+    parser.add_argument('--min-seconds', type=float, default=0.05)
+    parser.add_argument('--min-mb', type=float, default=20.0)
+    args = parser.parse_args()
+    
+    generator = None
+    current = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': args.seed
+        },
+        'results': {}
+    }
+    for rows in args.rows:
+        path = dataset_path(args.data_dir, rows, args.seed)
+        if not os.path.exists(path):
+            generator = generator or FloodDataGenerator(CONFIG['data_path'], seed=args.seed)
+            generator.write(path, rows)
+        print(f"Benchmarking {rows} rows ({path})")
+        current['results'][str(rows)] = benchmark_dataset(path, CONFIG, args.models, args.predict_repeats)
+    
+    output = args.output or os.path.join('benchmarks', 'results', datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as handle:
+        json.dump(current, handle, indent=2)
+    print(f"Results written to {output}")
+    
+    if args.update_baseline:
+        with open(args.baseline, 'w') as handle:
+            json.dump(current, handle, indent=2)
+        print(f"Baseline updated at {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+    
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    regressions = compare(current, baseline, args.time_threshold, args.memory_threshold, args.min_seconds, args.min_mb)
+    for r in regressions:
+        print(f"REGRESSION {r['rows']} rows {r['stage']} {r['metric']}: {r['baseline']:.4f} -> {r['current']:.4f} ({r['ratio']:.2f}x)")
+    if regressions:
+        raise SystemExit(1)
+    print(f"No regressions against {args.baseline} (commit {baseline.get('meta', {}).get('commit')})")
+
+if __name__ == '__main__':
+    main()
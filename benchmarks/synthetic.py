@@ -0,0 +1,69 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+TARGET = 'FloodProbability'
+
+class FloodDataGenerator:
+    """Generate flood-like datasets matching the schema and marginal distributions of a reference CSV."""
+
+    def __init__(self, reference_path: str = 'data/flood.csv', seed: int = 42):
+        reference = pd.read_csv(reference_path)
+        self.seed = seed
+        self.columns = list(reference.columns)
+        self.features = [col for col in self.columns if col != TARGET]
+        
+        # Empirical marginal of each (integer-valued) feature
+        self.marginals = {}
+        for col in self.features:
+            counts = reference[col].value_counts(normalize=True).sort_index()
+            self.marginals[col] = (counts.index.to_numpy(), counts.to_numpy())
+        
+        # The target is a linear function of the features; keep its fit, residual spread, grid and range
+        X = np.hstack([np.ones((len(reference), 1)), reference[self.features].to_numpy(dtype=np.float64)])
+        y = reference[TARGET].to_numpy(dtype=np.float64)
+        self.weights = np.linalg.lstsq(X, y, rcond=None)[0]
+        self.noise_std = float(np.std(y - X @ self.weights))
+        self.target_step = float(np.min(np.diff(np.unique(y))))
+        self.target_range = (float(y.min()), float(y.max()))
+
+    def chunk(self, rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        data = {col: rng.choice(values, size=rows, p=probs) for col, (values, probs) in self.marginals.items()}
+        X = np.column_stack([data[col] for col in self.features]).astype(np.float64)
+        y = self.weights[0] + X @ self.weights[1:] + rng.normal(0, self.noise_std, rows)
+        y = np.clip(np.round(y / self.target_step) * self.target_step, *self.target_range)
+        data[TARGET] = np.round(y, 6)
+        return pd.DataFrame(data, columns=self.columns)
+
+    def write(self, path: str, rows: int, chunksize: int = 1000000) -> str:
+        """Write `rows` synthetic rows to a CSV in chunks, so memory stays bounded at any size."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        rng = np.random.default_rng(self.seed)
+        written = 0
+        with open(path, 'w', newline='') as handle:
+            while written < rows:
+                size = min(chunksize, rows - written)
+                self.chunk(size, rng).to_csv(handle, header=written == 0, index=False)
+                written += size
+        return path
+
+def dataset_path(data_dir: str, rows: int, seed: int) -> str:
+    return os.path.join(data_dir, f"flood_{rows}_seed{seed}.csv")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic flood datasets")
+    parser.add_argument('--rows', type=int, nargs='+', default=[50000, 1000000, 10000000])
+    parser.add_argument('--reference', default='data/flood.csv')
+    parser.add_argument('--data-dir', default='benchmarks/data')
+    parser.add_argument('--chunksize', type=int, default=1000000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    generator = FloodDataGenerator(args.reference, seed=args.seed)
+    for rows in args.rows:
+        path = generator.write(dataset_path(args.data_dir, rows, args.seed), rows, args.chunksize)
+        print(f"Wrote {rows} rows to {path}")
+
+if __name__ == '__main__':
+    main()
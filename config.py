@@ -3,9 +3,34 @@ CONFIG = {
     'test_size': 0.2,
     'random_state': 42,
     'model_params': {
+        'LinearRegression': {'alpha': 0.0, 'chunksize': 100000, 'n_jobs': 4},
         'RandomForest': {},
         'XGBoost': {},
         'LightGBM': {}
     },
-    'output_dir': 'models'
+    'selection': {
+        'objective': 'constrained',  # 'r2', 'constrained' or 'pareto'
+        'max_latency_ms': None,
+        'max_size_mb': None,
+        'max_memory_mb': None,
+        'r2_tolerance': 0.001,
+        'batch_size': 10000,
+        'latency_repeats': 100,
+        'batch_latency_repeats': 20
+    },
+    'distillation': {
+        'max_r2_gap': 0.005,
+        'latency_repeats': 100,
+        'surrogate_params': {
+            'Linear': {},
+            'ShallowTree': {'max_depth': 8, 'random_state': 42}
+        }
+    },
+    'sweep': {
+        'grid_points': 20,
+        'pd_sample_size': 500,
+        'cache_size': 256
+    },
+    'output_dir': 'models',
+    'parallel_stages': True
 }
\ No newline at end of file
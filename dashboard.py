@@ -1,5 +1,6 @@
 from state import FloodPredictionState
 from logger import structured_log
+from predictor import PredictorAgent
 import gradio as gr
 import plotly.express as px
 import plotly.graph_objects as go
@@ -11,6 +12,66 @@ class DashboardAgent:
     def __init__(self, config):
         self.config = config
         self.app = None  # Gradio interface will be set up in setup_dashboard
+        self.predictor = PredictorAgent(config)
+
+    def build_figures(self, state: FloodPredictionState) -> dict:
+        """Build the dashboard's static Plotly figures from the pipeline state."""
+        # Convert state data to DataFrame for visualization
+        metrics_df = pd.DataFrame.from_dict(state.model_metrics, orient='index')
+        
+        # Feature importance plot
+        feature_importance = pd.DataFrame({
+            'Feature': list(state.feature_importance.keys()),
+            'Importance': list(state.feature_importance.values())
+        }).sort_values(by='Importance', ascending=False)
+        
+        fig_importance = px.bar(
+            feature_importance,
+            x='Importance',
+            y='Feature',
+            title='Feature Importance',
+            orientation='h'
+        )
+        
+        # Prediction distribution
+        with pd.option_context('mode.use_inf_as_na', True):
+            fig_dist = px.histogram(
+                x=state.y_test,
+                nbins=30,
+                title='Prediction Distribution',
+                labels={'x': 'Flood Probability'}
+            )
+        
+        # Correlation heatmap
+        with pd.option_context('mode.use_inf_as_na', True):
+            corr_matrix = state.X_test.corr()
+            fig_corr = go.Figure(data=go.Heatmap(
+                z=corr_matrix.values,
+                x=corr_matrix.columns,
+                y=corr_matrix.columns,
+                colorscale='Viridis'
+            ))
+            fig_corr.update_layout(title='Feature Correlation Heatmap')
+        
+        # Model performance table
+        fig_table = go.Figure(data=[go.Table(
+            header=dict(values=['Model', 'R2 Score', 'MSE', 'p99 Latency (ms)', 'Size (MB)']),
+            cells=dict(values=[
+                metrics_df.index,
+                metrics_df['r2'].round(4),
+                metrics_df['mse'].round(4),
+                metrics_df['latency_p99_ms_batch1'].round(2),
+                metrics_df['size_mb'].round(2)
+            ])
+        )])
+        fig_table.update_layout(title='Model Performance Metrics')
+        
+        return {
+            'table': fig_table,
+            'importance': fig_importance,
+            'dist': fig_dist,
+            'corr': fig_corr
+        }
 
     def setup_dashboard(self, state: FloodPredictionState) -> FloodPredictionState:
         """Set up and start the Gradio dashboard with sliders and flood background."""
@@ -19,63 +80,33 @@ class DashboardAgent:
             if isinstance(state, dict):
                 state = FloodPredictionState(**state)
             
-            # Convert state data to DataFrame for visualization
-            metrics_df = pd.DataFrame.from_dict(state.model_metrics, orient='index')
-            
-            # Feature importance plot
-            feature_importance = pd.DataFrame({
-                'Feature': list(state.feature_importance.keys()),
-                'Importance': list(state.feature_importance.values())
-            }).sort_values(by='Importance', ascending=False)
-            
-            fig_importance = px.bar(
-                feature_importance,
-                x='Importance',
-                y='Feature',
-                title='Feature Importance',
-                orientation='h'
-            )
-            
-            # Prediction distribution
-            with pd.option_context('mode.use_inf_as_na', True):
-                fig_dist = px.histogram(
-                    x=state.y_test,
-                    nbins=30,
-                    title='Prediction Distribution',
-                    labels={'x': 'Flood Probability'}
-                )
-            
-            # Correlation heatmap
-            with pd.option_context('mode.use_inf_as_na', True):
-                corr_matrix = state.X_test.corr()
-                fig_corr = go.Figure(data=go.Heatmap(
-                    z=corr_matrix.values,
-                    x=corr_matrix.columns,
-                    y=corr_matrix.columns,
-                    colorscale='Viridis'
-                ))
-                fig_corr.update_layout(title='Feature Correlation Heatmap')
+            figures = self.build_figures(state)
             
-            # Model performance table
-            fig_table = go.Figure(data=[go.Table(
-                header=dict(values=['Model', 'R2 Score', 'MSE']),
-                cells=dict(values=[
-                    metrics_df.index,
-                    metrics_df['r2'].round(4),
-                    metrics_df['mse'].round(4)
-                ])
-            )])
-            fig_table.update_layout(title='Model Performance Metrics')
+            # Serve the distilled surrogate when its accuracy gap is within budget
+            serving_model = self.predictor.serving_model(state)
+            serving_name = state.surrogate_name if serving_model is state.surrogate_model else state.best_model_name
             
             # Define prediction function
             def make_prediction(*input_values):
                 try:
                     input_data = pd.DataFrame([input_values], columns=state.X_test.columns)
-                    prediction = state.best_model.predict(input_data)[0]
+                    prediction = serving_model.predict(input_data)[0]
                     return f"Predicted Flood Probability: {prediction:.4f}"
                 except Exception as e:
                     return f"Error in prediction: {str(e)}"
             
+            # Define what-if sweep function: one batched prediction per sweep
+            def make_sweep(features, *input_values):
+                try:
+                    if not features:
+                        return None
+                    base_input = dict(zip(state.X_test.columns, input_values))
+                    result = self.predictor.sweep(state, base_input, features)
+                    return self._sweep_figure(result, base_input)
+                except Exception as e:
+                    structured_log('ERROR', f"Error in sweep: {str(e)}")
+                    return None
+            
             # CSS for flood background
             css = """
             .gradio-container {
@@ -103,22 +134,23 @@ class DashboardAgent:
                 
                 # Model performance
                 gr.Markdown("## Model Performance")
-                gr.Plot(fig_table, label="Model Performance Metrics")
+                gr.Plot(figures['table'], label="Model Performance Metrics")
                 
                 # Feature importance
                 gr.Markdown("## Feature Importance")
-                gr.Plot(fig_importance, label="Feature Importance")
+                gr.Plot(figures['importance'], label="Feature Importance")
                 
                 # Prediction distribution
                 gr.Markdown("## Prediction Distribution")
-                gr.Plot(fig_dist, label="Prediction Distribution")
+                gr.Plot(figures['dist'], label="Prediction Distribution")
                 
                 # Correlation heatmap
                 gr.Markdown("## Feature Correlation")
-                gr.Plot(fig_corr, label="Feature Correlation Heatmap")
+                gr.Plot(figures['corr'], label="Feature Correlation Heatmap")
                 
                 # Prediction form with sliders
                 gr.Markdown("## Make a Prediction")
+                gr.Markdown(f"Serving model: {serving_name}")
                 inputs = []
                 for col in state.X_test.columns:
                     min_val = float(state.X_test[col].min())
@@ -142,6 +174,24 @@ class DashboardAgent:
                     inputs=inputs,
                     outputs=output
                 )
+                
+                # What-if sweep over one or two features
+                gr.Markdown("## What-if Sweep")
+                sweep_features = gr.Dropdown(
+                    choices=list(state.X_test.columns),
+                    value=[state.X_test.columns[0]],
+                    multiselect=True,
+                    max_choices=2,
+                    label="Features to vary"
+                )
+                sweep_button = gr.Button("Sweep")
+                sweep_plot = gr.Plot(label="What-if Curves")
+                
+                # Redraw the curves on demand and whenever a slider is released
+                sweep_button.click(fn=make_sweep, inputs=[sweep_features] + inputs, outputs=sweep_plot)
+                sweep_features.change(fn=make_sweep, inputs=[sweep_features] + inputs, outputs=sweep_plot)
+                for slider in inputs:
+                    slider.release(fn=make_sweep, inputs=[sweep_features] + inputs, outputs=sweep_plot)
             
             # Launch Gradio interface
             try:
@@ -162,4 +212,27 @@ class DashboardAgent:
         except Exception as e:
             structured_log('ERROR', f"Error setting up dashboard: {str(e)}")
             raise
-        return state
\ No newline at end of file
+        return state
+
+    def _sweep_figure(self, result: dict, base_input: dict) -> go.Figure:
+        """Plot a sweep: ICE and dataset PD curves for one feature, a heatmap for two."""
+        features = result['features']
+        if len(features) == 1:
+            feature = features[0]
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=result['grid'][feature], y=result['predictions'], mode='lines+markers', name='This input (ICE)'))
+            pd_curve = result['pd'].get(feature)
+            if pd_curve:
+                fig.add_trace(go.Scatter(x=pd_curve['grid'], y=pd_curve['pd'], mode='lines', name='Dataset average (PD)', line=dict(dash='dash')))
+            fig.add_vline(x=base_input[feature], line_dash='dot')
+            fig.update_layout(title=f'What-if: {feature}', xaxis_title=feature, yaxis_title='Flood Probability')
+        else:
+            fig = go.Figure(data=go.Heatmap(
+                z=result['predictions'],
+                x=result['grid'][features[1]],
+                y=result['grid'][features[0]],
+                colorscale='Viridis',
+                colorbar=dict(title='Flood Probability')
+            ))
+            fig.update_layout(title=f'What-if: {features[0]} x {features[1]}', xaxis_title=features[1], yaxis_title=features[0])
+        return fig
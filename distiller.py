@@ -0,0 +1,84 @@
+from state import FloodPredictionState
+from logger import structured_log
+from profiler import predict_latency_ms, serialized_size_mb
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+from sklearn.metrics import r2_score, mean_squared_error
+import numpy as np
+
+class DistillerAgent:
+    def __init__(self, config):
+        self.config = config
+        self.distill_config = config.get('distillation', {})
+        self.surrogates = {
+            'Linear': LinearRegression,
+            'ShallowTree': DecisionTreeRegressor
+        }
+
+    def distill_model(self, state: FloodPredictionState) -> FloodPredictionState:
+        """Fit compact surrogates to the best model's predictions and serve the fastest one that is worth it.
+
+        A surrogate qualifies when its R2 gap is within max_r2_gap and it is faster and no larger than
+        the teacher; if none qualifies, the teacher keeps serving.
+        """
+        try:
+            if state.best_model is None or state.X_train is None or state.X_test is None:
+                raise ValueError("Best model or training data not available for distillation")
+
+            # Soft targets: the teacher's predictions on the training data
+            teacher_train = state.best_model.predict(state.X_train)
+            teacher_test = state.best_model.predict(state.X_test)
+            teacher_r2 = r2_score(state.y_test, teacher_test)
+            teacher_mse = mean_squared_error(state.y_test, teacher_test)
+            teacher_latency = self._latency_ms(state.best_model, state.X_test)
+            teacher_size = serialized_size_mb(state.best_model)
+            max_gap = self.distill_config.get('max_r2_gap', 0.005)
+
+            best = None
+            for name, surrogate_class in self.surrogates.items():
+                params = self.distill_config.get('surrogate_params', {}).get(name, {})
+                surrogate = surrogate_class(**params)
+                surrogate.fit(state.X_train, teacher_train)
+                y_pred = surrogate.predict(state.X_test)
+                r2 = r2_score(state.y_test, y_pred)
+                mse = mean_squared_error(state.y_test, y_pred)
+                metrics = {
+                    'r2': r2,
+                    'mse': mse,
+                    'r2_gap': teacher_r2 - r2,
+                    'mse_gap': mse - teacher_mse,
+                    'fidelity_r2': r2_score(teacher_test, y_pred),
+                    'latency_ms': self._latency_ms(surrogate, state.X_test),
+                    'teacher_latency_ms': teacher_latency,
+                    'size_mb': serialized_size_mb(surrogate),
+                    'teacher_size_mb': teacher_size
+                }
+                qualifies = (metrics['r2_gap'] <= max_gap
+                             and metrics['latency_ms'] < teacher_latency
+                             and metrics['size_mb'] <= teacher_size)
+                structured_log('INFO', f"Distilled {name} from {state.best_model_name}", qualifies=qualifies, **metrics)
+                # Among qualifying surrogates, the fastest one serves
+                if qualifies and (best is None or metrics['latency_ms'] < best[2]['latency_ms']):
+                    best = (name, surrogate, metrics)
+
+            if best is None:
+                state.surrogate_name, state.surrogate_model, state.surrogate_metrics = None, None, None
+                state.use_surrogate = False
+                structured_log('INFO', f"No surrogate is within the R2 gap and faster than {state.best_model_name}; serving the teacher",
+                               max_r2_gap=max_gap, teacher_latency_ms=teacher_latency)
+            else:
+                state.surrogate_name, state.surrogate_model, state.surrogate_metrics = best
+                state.use_surrogate = True
+                structured_log('INFO', f"Surrogate {state.surrogate_name} enabled for serving",
+                               r2_gap=state.surrogate_metrics['r2_gap'], max_r2_gap=max_gap,
+                               latency_ms=state.surrogate_metrics['latency_ms'], teacher_latency_ms=teacher_latency)
+
+        except Exception as e:
+            structured_log('ERROR', f"Error in model distillation: {str(e)}")
+            raise
+        return state
+
+    def _latency_ms(self, model, X):
+        """Median single-row predict latency in milliseconds, timed the same way as the tuner's profile."""
+        timings = predict_latency_ms(model, X.iloc[0:1], self.distill_config.get('latency_repeats', 100))
+        return float(np.median(timings))
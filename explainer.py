@@ -1,13 +1,16 @@
 from state import FloodPredictionState
 from logger import structured_log
+from predictor import PredictorAgent, feature_grid
 import numpy as np
+import pandas as pd
 
 class ExplainerAgent:
     def __init__(self, config):
         self.config = config
+        self.predictor = PredictorAgent(config)
 
     def explain_model(self, state: FloodPredictionState) -> FloodPredictionState:
-        """Compute feature importance for the best model."""
+        """Compute feature importance for the best model and partial dependence for the serving model."""
         try:
             if state.best_model is None or state.X_train is None:
                 raise ValueError("Best model or training data not available")
@@ -28,7 +31,30 @@ class ExplainerAgent:
             print("Feature Importance Types:", {k: type(v).__name__ for k, v in state.feature_importance.items()})
             structured_log('INFO', "Computed feature importance", features=state.feature_importance)
             
+            # PD uses the serving model so it matches the dashboard's ICE curves
+            state.pd_curves = self.partial_dependence(self.predictor.serving_model(state), state.X_train)
+            structured_log('INFO', "Computed partial dependence curves", features=list(state.pd_curves))
+            
         except Exception as e:
             structured_log('ERROR', f"Error in explaining model: {str(e)}")
             raise
-        return state
\ No newline at end of file
+        return state
+
+    def partial_dependence(self, model, X: pd.DataFrame) -> dict:
+        """Average the model's predictions over a sample of rows for each value on a per-feature grid."""
+        sweep_config = self.config.get('sweep', {})
+        grid_points = sweep_config.get('grid_points', 20)
+        sample = X.sample(n=min(sweep_config.get('pd_sample_size', 500), len(X)), random_state=self.config['random_state'])
+        
+        curves = {}
+        for feature in X.columns:
+            grid = feature_grid(X[feature], grid_points)
+            # One batch per feature: the sample repeated once per grid value
+            batch = pd.concat([sample] * len(grid), ignore_index=True)
+            batch[feature] = np.repeat(grid, len(sample))
+            predictions = model.predict(batch).reshape(len(grid), len(sample))
+            curves[str(feature)] = {
+                'grid': [float(value) for value in grid],
+                'pd': [float(value) for value in predictions.mean(axis=1)]
+            }
+        return curves
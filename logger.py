@@ -26,6 +26,8 @@ def structured_log(level: str, message: str, **kwargs):
     log_dict = convert_to_serializable(log_dict)  # Apply to entire dictionary
     if level.upper() == 'INFO':
         logging.info(json.dumps(log_dict))
+    elif level.upper() == 'WARNING':
+        logging.warning(json.dumps(log_dict))
     elif level.upper() == 'ERROR':
         logging.error(json.dumps(log_dict))
     else:
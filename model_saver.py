@@ -21,6 +21,11 @@ class ModelSaverAgent:
             joblib.dump(state.best_model, model_path)
             structured_log('INFO', f"Saved best model {state.best_model_name} to {model_path}")
             
+            if state.surrogate_model is not None:
+                surrogate_path = os.path.join(self.output_dir, f"{state.best_model_name}_{state.surrogate_name}_surrogate.joblib")
+                joblib.dump(state.surrogate_model, surrogate_path)
+                structured_log('INFO', f"Saved surrogate {state.surrogate_name} to {surrogate_path}")
+            
         except Exception as e:
             structured_log('ERROR', f"Error saving model: {str(e)}")
             raise
@@ -3,12 +3,14 @@ from logger import structured_log
 from sklearn.ensemble import RandomForestRegressor
 from xgboost import XGBRegressor
 from lightgbm import LGBMRegressor
+from streaming_linear import StreamingLinearRegression
 from sklearn.metrics import r2_score, mean_squared_error
 
 class ModelTrainerAgent:
     def __init__(self, config):
         self.config = config
         self.models = {
+            'LinearRegression': StreamingLinearRegression,
             'RandomForest': RandomForestRegressor,
             'XGBoost': XGBRegressor,
             'LightGBM': LGBMRegressor
@@ -43,13 +45,8 @@ class ModelTrainerAgent:
                 # Store metrics
                 state.model_metrics[model_name] = {'r2': r2, 'mse': mse}
                 structured_log('INFO', f"{model_name} metrics", r2=r2, mse=mse)
-                
-                # Update best model if this is the first model or has better R2
-                if state.best_model is None or r2 > state.model_metrics[state.best_model_name]['r2']:
-                    state.best_model = model
-                    state.best_model_name = model_name
-                    structured_log('INFO', f"New best model: {model_name}", r2=r2)
             
+            # The winner is chosen by ModelTunerAgent once every candidate has been profiled
         except Exception as e:
             structured_log('ERROR', f"Error in model training: {str(e)}")
             raise
@@ -1,27 +1,83 @@
 from state import FloodPredictionState
 from logger import structured_log
+from profiler import profile_model
+import uuid
 
 class ModelTunerAgent:
     def __init__(self, config):
         self.config = config
+        self.selection = config.get('selection', {})
 
     def tune_best_model(self, state: FloodPredictionState) -> FloodPredictionState:
-        """Select the best model from trained models based on R2 score."""
+        """Profile the trained models and select the best one under the configured objective."""
         try:
             if not state.models or not state.model_metrics:
                 raise ValueError("No models or metrics available for tuning")
             
-            # Find the model with the highest R2 score
-            best_model_name = max(
-                state.model_metrics,
-                key=lambda x: state.model_metrics[x]['r2']
-            )
+            # Record size, memory and latency alongside the accuracy metrics
+            for model_name, model in state.models.items():
+                state.model_metrics[model_name].update(profile_model(
+                    model,
+                    state.X_test,
+                    batch_size=self.selection.get('batch_size', 10000),
+                    repeats=self.selection.get('latency_repeats', 100),
+                    batch_repeats=self.selection.get('batch_latency_repeats', 20),
+                    random_state=self.config['random_state']
+                ))
+            
+            objective = self.selection.get('objective', 'constrained')
+            if objective == 'r2':
+                best_model_name = self._highest_r2(state.model_metrics, list(state.model_metrics))
+            elif objective == 'constrained':
+                best_model_name = self._within_budgets(state.model_metrics)
+            elif objective == 'pareto':
+                best_model_name = self._pareto(state.model_metrics)
+            else:
+                raise ValueError(f"Unknown selection objective: {objective}")
             
             state.best_model = state.models[best_model_name]
             state.best_model_name = best_model_name
-            structured_log('INFO', f"Selected best model: {best_model_name}", r2=state.model_metrics[best_model_name]['r2'])
+            state.model_version = f"{best_model_name}-{uuid.uuid4().hex[:8]}"
+            structured_log('INFO', f"Selected best model: {best_model_name}", r2=state.model_metrics[best_model_name]['r2'],
+                           objective=objective, model_version=state.model_version)
             
         except Exception as e:
             structured_log('ERROR', f"Error in model tuning: {str(e)}")
             raise
-        return state
\ No newline at end of file
+        return state
+
+    def _highest_r2(self, metrics, candidates):
+        return max(candidates, key=lambda x: metrics[x]['r2'])
+
+    def _within_budgets(self, metrics):
+        """Highest R2 among models meeting the latency, size and memory budgets."""
+        budgets = {
+            'latency_p99_ms_batch1': self.selection.get('max_latency_ms'),
+            'size_mb': self.selection.get('max_size_mb'),
+            'memory_mb': self.selection.get('max_memory_mb')
+        }
+        feasible = [
+            name for name, m in metrics.items()
+            if all(limit is None or m[key] <= limit for key, limit in budgets.items())
+        ]
+        if not feasible:
+            structured_log('WARNING', "No model meets the selection budgets; falling back to highest R2", budgets=budgets)
+            feasible = list(metrics)
+        return self._highest_r2(metrics, feasible)
+
+    def _pareto(self, metrics):
+        """Fastest model on the R2/latency/size Pareto front whose R2 is within tolerance of the best."""
+        def dominates(a, b):
+            no_worse = a['r2'] >= b['r2'] and a['latency_p99_ms_batch1'] <= b['latency_p99_ms_batch1'] and a['size_mb'] <= b['size_mb']
+            better = a['r2'] > b['r2'] or a['latency_p99_ms_batch1'] < b['latency_p99_ms_batch1'] or a['size_mb'] < b['size_mb']
+            return no_worse and better
+        
+        front = [name for name in metrics if not any(dominates(metrics[other], metrics[name]) for other in metrics if other != name)]
+        for name in metrics:
+            metrics[name]['pareto_optimal'] = float(name in front)
+        structured_log('INFO', "Pareto front", models=front)
+        
+        best_r2 = max(metrics[name]['r2'] for name in front)
+        tolerance = self.selection.get('r2_tolerance', 0.001)
+        close = [name for name in front if metrics[name]['r2'] >= best_r2 - tolerance]
+        return min(close, key=lambda x: metrics[x]['latency_p99_ms_batch1'])
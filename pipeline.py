@@ -0,0 +1,123 @@
+import time
+from langgraph.graph import StateGraph, START, END
+from state import FloodPredictionState
+from config import CONFIG
+from logger import structured_log
+from data_loader import DataLoaderAgent
+from preprocessor import PreprocessorAgent
+from model_trainer import ModelTrainerAgent
+from model_tuner import ModelTunerAgent
+from distiller import DistillerAgent
+from explainer import ExplainerAgent
+from visualizer import VisualizerAgent
+from monitor import MonitorAgent
+from model_saver import ModelSaverAgent
+from predictor import PredictorAgent
+from dashboard import DashboardAgent
+
+class FloodPredictionWorkflow:
+    def __init__(self, config, analysis_only: bool = False):
+        self.config = config
+        self.data_loader = DataLoaderAgent()
+        self.preprocessor = PreprocessorAgent(config)
+        self.model_trainer = ModelTrainerAgent(config)
+        self.model_tuner = ModelTunerAgent(config)
+        self.distiller = DistillerAgent(config)
+        self.explainer = ExplainerAgent(config)
+        self.visualizer = VisualizerAgent(config)
+        self.monitor = MonitorAgent()
+        self.model_saver = ModelSaverAgent(config)
+        self.predictor = PredictorAgent(config)
+        self.dashboard = DashboardAgent(config)
+        # The analysis-only graph runs just the fan-out section on an already tuned state (used by benchmarks)
+        self.graph = self._build_analysis_graph() if analysis_only else self._build_graph()
+
+    def _build_graph(self):
+        graph = StateGraph(FloodPredictionState)
+        graph.add_node("load_data", self.data_loader.load_data)
+        graph.add_node("preprocess_data", self.preprocessor.preprocess_data)
+        graph.add_node("train_models", self.model_trainer.train_models)
+        graph.add_node("tune_best_model", self.model_tuner.tune_best_model)
+        graph.add_node("distill_model", self.distiller.distill_model)
+        graph.add_node("make_sample_prediction", self.predictor.make_sample_prediction)
+        graph.add_node("setup_dashboard", self.dashboard.setup_dashboard)
+        graph.add_edge("load_data", "preprocess_data")
+        graph.add_edge("preprocess_data", "train_models")
+        graph.add_edge("train_models", "tune_best_model")
+        graph.add_edge("tune_best_model", "distill_model")
+        self._add_analysis_stages(graph, "distill_model")
+        graph.add_edge("merge_stages", "make_sample_prediction")
+        graph.add_edge("make_sample_prediction", "setup_dashboard")
+        graph.add_edge("setup_dashboard", END)
+        graph.set_entry_point("load_data")
+        return graph.compile()
+
+    def _build_analysis_graph(self):
+        graph = StateGraph(FloodPredictionState)
+        self._add_analysis_stages(graph, START)
+        graph.add_edge("merge_stages", END)
+        return graph.compile()
+
+    def _add_analysis_stages(self, graph, source):
+        """Add the analysis stages after `source`, fanned out or chained per config, joined at merge_stages."""
+        for name, (agent_fn, outputs) in self._analysis_stages().items():
+            graph.add_node(name, self._stage(name, agent_fn, outputs))
+        graph.add_node("merge_stages", self.merge_stages)
+        stages = list(self._analysis_stages())
+        if self.config.get('parallel_stages', True):
+            # Fan out: the analysis stages only read the tuned model, so they run concurrently
+            for name in stages:
+                graph.add_edge(source, name)
+            graph.add_edge(stages, "merge_stages")
+        else:
+            previous = source
+            for name in stages:
+                graph.add_edge(previous, name)
+                previous = name
+            graph.add_edge(previous, "merge_stages")
+
+    def _analysis_stages(self):
+        """Stages that depend only on the tuned model, mapped to the state fields they produce."""
+        return {
+            "explain_model": (self.explainer.explain_model, ('feature_importance', 'pd_curves')),
+            "visualize_data": (self.visualizer.visualize_data, ()),
+            "monitor_performance": (self.monitor.monitor_performance, ()),
+            "save_model": (self.model_saver.save_model, ()),
+        }
+
+    def _stage(self, name, agent_fn, outputs):
+        """Wrap an agent so it only writes the fields it owns, letting branches run side by side."""
+        def run_stage(state: FloodPredictionState) -> dict:
+            start = time.perf_counter()
+            state = agent_fn(state)
+            structured_log('INFO', f"Stage {name} finished", seconds=time.perf_counter() - start)
+            return {field: getattr(state, field) for field in outputs}
+        return run_stage
+
+    def merge_stages(self, state: FloodPredictionState) -> dict:
+        """Fan-in point for the analysis stages; their outputs are already merged into the state."""
+        if state.feature_importance is None:
+            raise ValueError("Feature importance missing after analysis stages")
+        structured_log('INFO', "Merged analysis stage outputs", stages=list(self._analysis_stages()))
+        return {}
+
+    def run(self):
+        try:
+            structured_log('INFO', "Starting flood prediction pipeline",
+                           parallel_stages=self.config.get('parallel_stages', True))
+            start = time.perf_counter()
+            initial_state = FloodPredictionState(data_path=self.config['data_path'])
+            final_state = self.graph.invoke(initial_state)
+            structured_log('INFO', "Pipeline completed successfully", wall_time_seconds=time.perf_counter() - start)
+            return final_state
+        except Exception as e:
+            structured_log('ERROR', f"Pipeline failed: {str(e)}")
+            raise
+
+    def run_analysis(self, state: FloodPredictionState):
+        """Run only the analysis stages on a tuned state; requires analysis_only=True."""
+        start = time.perf_counter()
+        final_state = self.graph.invoke(state)
+        structured_log('INFO', "Analysis stages completed", parallel_stages=self.config.get('parallel_stages', True),
+                       wall_time_seconds=time.perf_counter() - start)
+        return final_state
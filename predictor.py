@@ -1,20 +1,44 @@
 from state import FloodPredictionState
 from logger import structured_log
+from preprocessor import engineer_features
+from collections import OrderedDict
+import copy
+import numpy as np
 import pandas as pd
 
+def feature_grid(values, grid_points: int = 20) -> np.ndarray:
+    """Observed values of a feature, evenly subsampled when there are more than grid_points of them."""
+    observed = np.unique(values).astype(float)
+    if len(observed) <= grid_points:
+        return observed
+    # Pick observed values rather than spanning the range, so grid points stay on the data's support
+    return observed[np.unique(np.round(np.linspace(0, len(observed) - 1, grid_points)).astype(int))]
+
 class PredictorAgent:
+    def __init__(self, config=None):
+        self.sweep_config = (config or {}).get('sweep', {})
+        self._sweep_cache = OrderedDict()
+
+    def serving_model(self, state):
+        """Return the distilled surrogate when it is enabled, otherwise the best model."""
+        use_surrogate = state.get('use_surrogate') if isinstance(state, dict) else state.use_surrogate
+        surrogate_model = state.get('surrogate_model') if isinstance(state, dict) else state.surrogate_model
+        if use_surrogate and surrogate_model is not None:
+            return surrogate_model
+        return state['best_model'] if isinstance(state, dict) else state.best_model
+
     def make_sample_prediction(self, state) -> FloodPredictionState:
-        """Make a sample prediction using the best model."""
+        """Make a sample prediction using the serving model."""
         try:
             # Handle state as dict or FloodPredictionState
-            best_model = state['best_model'] if isinstance(state, dict) else state.best_model
+            model = self.serving_model(state)
             X_test = state['X_test'] if isinstance(state, dict) else state.X_test
             
-            if best_model is None or X_test is None:
-                raise ValueError("Best model or test data not available")
+            if model is None or X_test is None:
+                raise ValueError("Serving model or test data not available")
             
             sample_data = X_test.iloc[0:1]
-            prediction = best_model.predict(sample_data)[0]
+            prediction = model.predict(sample_data)[0]
             structured_log('INFO', f"Sample prediction for first test instance: {prediction:.4f}")
             
         except Exception as e:
@@ -26,25 +50,76 @@ class PredictorAgent:
         """Make a prediction for given input data."""
         try:
             # Handle state as dict or FloodPredictionState
-            best_model = state['best_model'] if isinstance(state, dict) else state.best_model
+            model = self.serving_model(state)
             X_test = state['X_test'] if isinstance(state, dict) else state.X_test
             
-            input_df = pd.DataFrame([input_data])
-            
-            # Check if input_df already matches X_test columns
-            if set(input_df.columns) == set(X_test.columns):
-                input_df = input_df[X_test.columns]  # Ensure column order
-            else:
-                # Apply feature engineering to match training data
-                input_df['Monsoon_Drainage'] = input_df['MonsoonIntensity'] * input_df['TopographyDrainage']
-                input_df['Urban_Climate'] = input_df['Urbanization'] * input_df['ClimateChange']
-                input_df['LandslideRisk'] = input_df['Landslides'] + input_df['TopographyDrainage']
-                input_df['InadequateInfrastructure'] = input_df['DeterioratingInfrastructure'] + input_df['DrainageSystems']
-                input_df = input_df.drop(columns=['TopographyDrainage', 'Deforestation', 'DeterioratingInfrastructure', 'DrainageSystems'], errors='ignore')
-                input_df = input_df[X_test.columns]  # Ensure column order matches X_test
-            
-            prediction = best_model.predict(input_df)[0]
+            input_df = self._prepare_input(pd.DataFrame([input_data]), X_test.columns)
+            
+            prediction = model.predict(input_df)[0]
             return prediction
         except Exception as e:
             structured_log('ERROR', f"Error in prediction: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def sweep(self, state, base_input: dict, features, grid: dict = None) -> dict:
+        """Predict over a grid of one or two features around a base input in a single batch."""
+        try:
+            model = self.serving_model(state)
+            X_train = state['X_train'] if isinstance(state, dict) else state.X_train
+            X_test = state['X_test'] if isinstance(state, dict) else state.X_test
+            model_version = state.get('model_version') if isinstance(state, dict) else state.model_version
+            pd_curves = (state.get('pd_curves') if isinstance(state, dict) else state.pd_curves) or {}
+            
+            features = list(features)
+            if not 1 <= len(features) <= 2:
+                raise ValueError("Sweep supports one or two features")
+            grids = {feature: self._sweep_grid(X_train, feature, (grid or {}).get(feature)) for feature in features}
+            
+            # Curves depend only on the model, base input and grid, so repeat sweeps are served from cache
+            cache_key = (
+                model_version, type(model).__name__,
+                tuple(sorted(base_input.items())),
+                tuple((feature, tuple(values)) for feature, values in grids.items())
+            )
+            if cache_key in self._sweep_cache:
+                self._sweep_cache.move_to_end(cache_key)
+                return copy.deepcopy(self._sweep_cache[cache_key])
+            
+            # Build the full grid as one batch: one row per grid point, base values everywhere else
+            mesh = np.meshgrid(*grids.values(), indexing='ij')
+            batch = pd.DataFrame({name: np.full(mesh[0].size, value) for name, value in base_input.items()})
+            for feature, values in zip(features, mesh):
+                batch[feature] = values.ravel()
+            batch = self._prepare_input(batch, X_test.columns)
+            predictions = model.predict(batch).reshape(mesh[0].shape)
+            
+            result = {
+                'features': features,
+                'grid': {feature: values.tolist() for feature, values in grids.items()},
+                'predictions': predictions.tolist(),
+                'pd': {feature: pd_curves.get(feature) for feature in features}
+            }
+            self._sweep_cache[cache_key] = result
+            if len(self._sweep_cache) > self.sweep_config.get('cache_size', 256):
+                self._sweep_cache.popitem(last=False)
+            structured_log('INFO', "Computed what-if sweep", features=features, rows=len(batch))
+            # Hand out copies so callers cannot mutate the cached entry
+            return copy.deepcopy(result)
+        except Exception as e:
+            structured_log('ERROR', f"Error in sweep: {str(e)}")
+            raise
+
+    def _sweep_grid(self, X_train, feature, values=None) -> np.ndarray:
+        """Grid for a swept feature: explicit values, else the shared feature grid over the training data."""
+        if values is not None:
+            return np.asarray(values, dtype=float)
+        if feature not in X_train.columns:
+            raise ValueError(f"No grid given for {feature} and it is not a model feature")
+        return feature_grid(X_train[feature], self.sweep_config.get('grid_points', 20))
+
+    def _prepare_input(self, input_df: pd.DataFrame, columns) -> pd.DataFrame:
+        """Apply feature engineering to raw inputs and order columns as in training."""
+        # Check if input_df already matches the model columns
+        if set(input_df.columns) != set(columns):
+            input_df = engineer_features(input_df)
+        return input_df[columns]
@@ -3,6 +3,16 @@ from logger import structured_log
 from sklearn.model_selection import train_test_split
 import pandas as pd
 
+DROPPED_COLUMNS = ['TopographyDrainage', 'Deforestation', 'DeterioratingInfrastructure', 'DrainageSystems']
+
+def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the engineered interaction features and drop the raw columns they replace."""
+    df['Monsoon_Drainage'] = df['MonsoonIntensity'] * df['TopographyDrainage']
+    df['Urban_Climate'] = df['Urbanization'] * df['ClimateChange']
+    df['LandslideRisk'] = df['Landslides'] + df['TopographyDrainage']
+    df['InadequateInfrastructure'] = df['DeterioratingInfrastructure'] + df['DrainageSystems']
+    return df.drop(columns=DROPPED_COLUMNS, errors='ignore')
+
 class PreprocessorAgent:
     def __init__(self, config):
         self.config = config
@@ -13,16 +23,9 @@ class PreprocessorAgent:
             if state.df is None:
                 raise ValueError("No dataset available for preprocessing")
             
-            # Feature engineering
-            state.df['Monsoon_Drainage'] = state.df['MonsoonIntensity'] * state.df['TopographyDrainage']
-            state.df['Urban_Climate'] = state.df['Urbanization'] * state.df['ClimateChange']
-            state.df['LandslideRisk'] = state.df['Landslides'] + state.df['TopographyDrainage']
-            state.df['InadequateInfrastructure'] = state.df['DeterioratingInfrastructure'] + state.df['DrainageSystems']
-            
-            # Drop specified columns
-            columns_to_drop = ['TopographyDrainage', 'Deforestation', 'DeterioratingInfrastructure', 'DrainageSystems']
-            state.df = state.df.drop(columns=columns_to_drop, errors='ignore')
-            structured_log('INFO', f"Dropped columns: {columns_to_drop}")
+            # Feature engineering and drop the replaced columns
+            state.df = engineer_features(state.df)
+            structured_log('INFO', f"Dropped columns: {DROPPED_COLUMNS}")
             
             # Split features and target
             X = state.df.drop(columns=['FloodProbability'])
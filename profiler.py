@@ -0,0 +1,69 @@
+from logger import structured_log
+import numpy as np
+import joblib
+import psutil
+import tracemalloc
+import time
+import gc
+import io
+
+def predict_latency_ms(model, batch, repeats: int) -> list:
+    """Wall-clock predict timings for one batch, in milliseconds, after one discarded warm-up call."""
+    model.predict(batch)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(batch)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def serialized_size_mb(model) -> float:
+    """Size of the joblib-serialized model in megabytes."""
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.tell() / 1e6
+
+def profile_model(model, X, batch_size: int = 10000, repeats: int = 100, batch_repeats: int = 20,
+                  random_state: int = 42) -> dict:
+    """Measure serialized size, load time, memory and predict latency for a fitted model.
+
+    memory_mb is a rough estimate of the loaded model's footprint: the larger of the traced Python
+    allocation peak during the load (which includes NumPy buffers) and the process RSS growth
+    (which catches native allocations such as LightGBM/XGBoost boosters, but reads 0 when the
+    allocator reuses freed pages).
+    """
+    # Serialized size and load time, round-tripped through memory to keep disk speed out of it
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    size_bytes = buffer.tell()
+    buffer.seek(0)
+    
+    process = psutil.Process()
+    gc.collect()
+    rss_before = process.memory_info().rss
+    tracemalloc.start()
+    start = time.perf_counter()
+    loaded = joblib.load(buffer)
+    load_seconds = time.perf_counter() - start
+    traced_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    memory_bytes = max(traced_peak, process.memory_info().rss - rss_before, 0)
+    
+    # Latency at batch 1 and at a large batch drawn with replacement from X
+    single = X.iloc[0:1]
+    batch = X.sample(n=batch_size, replace=True, random_state=random_state)
+    single_timings = predict_latency_ms(loaded, single, repeats)
+    batch_timings = predict_latency_ms(loaded, batch, batch_repeats)
+    del loaded
+    
+    profile = {
+        'size_mb': size_bytes / 1e6,
+        'load_seconds': load_seconds,
+        'memory_mb': memory_bytes / 1e6,
+        'latency_p50_ms_batch1': float(np.percentile(single_timings, 50)),
+        'latency_p99_ms_batch1': float(np.percentile(single_timings, 99)),
+        f'latency_p50_ms_batch{batch_size}': float(np.percentile(batch_timings, 50)),
+        f'latency_p99_ms_batch{batch_size}': float(np.percentile(batch_timings, 99))
+    }
+    structured_log('INFO', f"Profiled {type(model).__name__}", **profile)
+    return profile
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import pandas as pd
 
 class FloodPredictionState(BaseModel):
@@ -12,8 +12,14 @@ class FloodPredictionState(BaseModel):
     models: Optional[Dict[str, Any]] = None
     best_model: Optional[Any] = None
     best_model_name: Optional[str] = None
+    model_version: Optional[str] = None
     model_metrics: Optional[Dict[str, Dict[str, float]]] = None
     feature_importance: Optional[Dict[str, float]] = None
+    pd_curves: Optional[Dict[str, Dict[str, List[float]]]] = None
+    surrogate_model: Optional[Any] = None
+    surrogate_name: Optional[str] = None
+    surrogate_metrics: Optional[Dict[str, float]] = None
+    use_surrogate: bool = False
 
     class Config:
         arbitrary_types_allowed = True
\ No newline at end of file
@@ -0,0 +1,154 @@
+from logger import structured_log
+from sklearn.exceptions import NotFittedError
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import numpy as np
+import pandas as pd
+
+class SufficientStats:
+    """Mergeable X^T X and X^T y accumulators over rows augmented with an intercept column."""
+
+    def __init__(self, n_features: int):
+        self.xtx = np.zeros((n_features + 1, n_features + 1))
+        self.xty = np.zeros(n_features + 1)
+        self.yty = 0.0
+
+    @classmethod
+    def from_chunk(cls, X, y) -> 'SufficientStats':
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        stats = cls(X.shape[1])
+        X_aug = np.hstack([np.ones((X.shape[0], 1)), X])
+        stats.xtx = X_aug.T @ X_aug
+        stats.xty = X_aug.T @ y
+        stats.yty = float(y @ y)
+        return stats
+
+    @property
+    def n_samples(self) -> int:
+        return int(round(self.xtx[0, 0]))
+
+    def merge(self, other: 'SufficientStats') -> 'SufficientStats':
+        self.xtx += other.xtx
+        self.xty += other.xty
+        self.yty += other.yty
+        return self
+
+    def solve(self, alpha: float = 0.0) -> np.ndarray:
+        """Closed-form ridge/OLS weights, intercept first; the intercept is not penalized."""
+        penalty = alpha * np.eye(self.xtx.shape[0])
+        penalty[0, 0] = 0.0
+        try:
+            return np.linalg.solve(self.xtx + penalty, self.xty)
+        except np.linalg.LinAlgError:
+            return np.linalg.lstsq(self.xtx + penalty, self.xty, rcond=None)[0]
+
+    def r2(self, weights: np.ndarray) -> float:
+        """R2 of the given weights on the rows these statistics were built from."""
+        sse = self.yty - 2 * weights @ self.xty + weights @ self.xtx @ weights
+        sst = self.yty - self.xty[0] ** 2 / self.xtx[0, 0]
+        return float(1 - sse / sst)
+
+class StreamingLinearRegression:
+    """Exact ridge/OLS regression trained in one pass from X^T X and X^T y accumulated over chunks."""
+
+    def __init__(self, alpha: float = 0.0, chunksize: int = 100000, n_jobs: int = 4):
+        self.alpha = alpha
+        self.chunksize = chunksize
+        self.n_jobs = n_jobs
+        self.stats_ = None
+        self.feature_names_in_ = None
+
+    def partial_fit(self, X, y) -> 'StreamingLinearRegression':
+        if isinstance(X, pd.DataFrame):
+            if self.stats_ is None:
+                self.feature_names_in_ = np.asarray(X.columns)
+            else:
+                X = self._align(X)
+        chunk_stats = SufficientStats.from_chunk(X, y)
+        self.stats_ = chunk_stats if self.stats_ is None else self.stats_.merge(chunk_stats)
+        return self._solve()
+
+    def fit(self, X, y) -> 'StreamingLinearRegression':
+        self.stats_ = None
+        self.feature_names_in_ = np.asarray(X.columns) if isinstance(X, pd.DataFrame) else None
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        for start in range(0, len(X), self.chunksize):
+            chunk_stats = SufficientStats.from_chunk(X[start:start + self.chunksize], y[start:start + self.chunksize])
+            self.stats_ = chunk_stats if self.stats_ is None else self.stats_.merge(chunk_stats)
+        return self._solve()
+
+    def fit_csv(self, path: str, target: str, transform=None, holdout_fraction: float = 0.2,
+                random_state: int = 42) -> 'StreamingLinearRegression':
+        """Fit from a CSV of any size in one read, scoring a random hold-out split from the same pass.
+
+        Each chunk is optionally transformed, split into train and hold-out rows and reduced to
+        sufficient statistics on a thread pool; the partials are merged as they complete.
+        """
+        train_stats = holdout_stats = None
+        pending = deque()
+
+        def reduce_chunk(index, chunk):
+            if transform is not None:
+                chunk = transform(chunk)
+            X = chunk.drop(columns=[target])
+            y = chunk[target]
+            holdout = np.random.default_rng([random_state, index]).random(len(chunk)) < holdout_fraction
+            return (list(X.columns),
+                    SufficientStats.from_chunk(X[~holdout], y[~holdout]),
+                    SufficientStats.from_chunk(X[holdout], y[holdout]))
+
+        def collect(future):
+            nonlocal train_stats, holdout_stats
+            columns, train_part, holdout_part = future.result()
+            self.feature_names_in_ = np.asarray(columns)
+            train_stats = train_part if train_stats is None else train_stats.merge(train_part)
+            holdout_stats = holdout_part if holdout_stats is None else holdout_stats.merge(holdout_part)
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            for index, chunk in enumerate(pd.read_csv(path, chunksize=self.chunksize)):
+                pending.append(executor.submit(reduce_chunk, index, chunk))
+                # Bound the chunks held in memory at once
+                if len(pending) >= 2 * self.n_jobs:
+                    collect(pending.popleft())
+            while pending:
+                collect(pending.popleft())
+
+        if train_stats is None:
+            raise ValueError(f"No rows read from {path}")
+        self.stats_ = train_stats
+        self._solve()
+        self.holdout_r2_ = holdout_stats.r2(self._weights) if holdout_stats.n_samples > 1 else float('nan')
+        structured_log('INFO', f"Streamed linear baseline from {path}", train_rows=train_stats.n_samples,
+                       holdout_rows=holdout_stats.n_samples, holdout_r2=self.holdout_r2_)
+        return self
+
+    def score(self, X, y) -> float:
+        """R2 on (X, y), accumulated chunk by chunk like the fit."""
+        X = np.asarray(self._align(X), dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        stats = SufficientStats(X.shape[1])
+        for start in range(0, len(X), self.chunksize):
+            stats.merge(SufficientStats.from_chunk(X[start:start + self.chunksize], y[start:start + self.chunksize]))
+        return stats.r2(self._weights)
+
+    def predict(self, X) -> np.ndarray:
+        return np.asarray(self._align(X), dtype=np.float64) @ self.coef_ + self.intercept_
+
+    def _align(self, X):
+        """Check the model is fitted and order DataFrame columns as seen in fit, since weights are positional."""
+        if self.stats_ is None:
+            raise NotFittedError("StreamingLinearRegression is not fitted yet; call fit, partial_fit or fit_csv first")
+        if isinstance(X, pd.DataFrame) and self.feature_names_in_ is not None:
+            missing = [name for name in self.feature_names_in_ if name not in X.columns]
+            if missing:
+                raise ValueError(f"Input is missing features seen in fit: {missing}")
+            return X[self.feature_names_in_]
+        return X
+
+    def _solve(self) -> 'StreamingLinearRegression':
+        self._weights = self.stats_.solve(self.alpha)
+        self.intercept_ = float(self._weights[0])
+        self.coef_ = self._weights[1:]
+        return self